@@ -4,10 +4,14 @@ Custom Welch's T-Test Library
 A Python library for performing Welch's 2-sided t-test on dataframe data.
 """
 
-from .core import welch_t_test
-from .exceptions import WelchTTestError, InvalidDataError, InvalidColumnError
+from .core import welch_t_test, welch_t_test_unchecked, welch_t_test_many
+from .exceptions import WelchTTestError, InvalidDataError, InvalidColumnError, StatisticalError
 
 __version__ = "1.0.0"
 __author__ = "Custom Library"
 
-__all__ = ["welch_t_test", "WelchTTestError", "InvalidDataError", "InvalidColumnError"]
\ No newline at end of file
+__all__ = [
+    "welch_t_test", "welch_t_test_unchecked", "welch_t_test_many",
+    "WelchTTestError", "InvalidDataError", "InvalidColumnError",
+    "StatisticalError",
+]
\ No newline at end of file
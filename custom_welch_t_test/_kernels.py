@@ -0,0 +1,46 @@
+"""
+Numeric kernels for Welch's t-test.
+
+The kernels operate on summary statistics only and accept either scalars or
+equally shaped arrays, so the same code serves single and batched tests.
+"""
+
+import numpy as np
+
+def welch_tdf(mean_1, var_1, n_1, mean_2, var_2, n_2):
+    """
+    Computes Welch's t-statistic and degrees of freedom from group statistics.
+    
+    Parameters:
+    mean_1, mean_2 (float or np.ndarray): Group means
+    var_1, var_2 (float or np.ndarray): Group sample variances (ddof=1)
+    n_1, n_2 (int or np.ndarray): Group sample sizes
+    
+    Returns:
+    tuple: (t_statistic, degrees_of_freedom)
+    """
+    # Each squared standard error is divided out once and reused below
+    a = var_1 / n_1
+    b = var_2 / n_2
+    se_sq = a + b
+    t_statistic = (mean_1 - mean_2) / np.sqrt(se_sq)
+    num = se_sq * se_sq
+    den = a * a / (n_1 - 1) + b * b / (n_2 - 1)
+    df = num / den
+    return t_statistic, df
+
+def two_sided_p_value(t_statistic, df):
+    """
+    Computes the 2-sided p-value of a t-statistic with df degrees of freedom.
+    
+    Parameters:
+    t_statistic (float or np.ndarray): t-statistic
+    df (float or np.ndarray): Degrees of freedom
+    
+    Returns:
+    float or np.ndarray: 2-sided p-value
+    """
+    # Imported lazily so importing the package does not pay for scipy
+    from scipy.special import stdtr
+    
+    return 2.0 * stdtr(df, -np.abs(t_statistic))
@@ -1,14 +1,202 @@
 """
 Core functionality for Welch's t-test analysis.
+
+Group statistics of large dataframes are memoized per dataframe, with at
+most _CACHE_MAXSIZE entries each. Staleness detection relies on pandas
+copy-on-write, so the cache is disabled on pandas 2.x unless
+mode.copy_on_write is enabled; there every call recomputes.
 """
 
+import weakref
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
-from scipy.stats import ttest_ind
-from .exceptions import WelchTTestError, InvalidDataError, InvalidColumnError
-from .utils import validate_inputs, extract_groups
+from .exceptions import InvalidDataError, InvalidColumnError, StatisticalError
+from .utils import (validate_inputs, extract_groups, check_group_sizes,
+                    check_numeric_column, build_group_indexers)
+from ._kernels import welch_tdf, two_sided_p_value
+
+# Group statistics per dataframe, keyed by id(dataframe) and then by
+# (independent_var_col, dependent_var_col, control_value, test_value).
+# Each entry is (stats, backing arrays, column Series) for staleness checks.
+_stats_cache = {}
+
+# Smaller dataframes are cheaper to re-aggregate than to track in the cache
+_CACHE_MIN_ROWS = 10_000
+
+# Most recently used entries kept per dataframe
+_CACHE_MAXSIZE = 32
+
+# Errors from _compute_welch that are reported as StatisticalError. Under
+# NumPy's default error state zero variances give NaN/inf results instead;
+# FloatingPointError is raised when the caller enables np.errstate(...='raise').
+# Non-numeric dependent columns are rejected by check_numeric_column upstream.
+_NUMERIC_ERRORS = (FloatingPointError, ZeroDivisionError)
+
+# Keys of the dictionary returned by welch_t_test, in display order
+_RESULT_TEMPLATE = dict.fromkeys([
+    't_statistic', 'p_value', 'degrees_of_freedom', 'mean_control', 'mean_test',
+    'std_control', 'std_test', 'n_control', 'n_test', 'mean_difference',
+    'control_value', 'test_value'
+])
+
+def _fused_stats(vec):
+    """
+    Computes the sample size, mean and sample standard deviation of a vector.
+    
+    The mean is computed once and reused for the sum of squared deviations,
+    so the data is traversed twice instead of once per statistic.
+    
+    Parameters:
+    vec (np.ndarray): 1-D array of observations
+    
+    Returns:
+    tuple: (n, mean, std) where std uses ddof=1
+    """
+    n = vec.size
+    mean = vec.sum() / n
+    deviations = vec - mean
+    std = np.sqrt(np.dot(deviations, deviations) / (n - 1))
+    return n, mean, std
+
+def _group_stats(dataframe, independent_var_col, dependent_var_col, control_test_values):
+    """
+    Computes per-group statistics from the extracted group vectors.
+    
+    Parameters:
+    dataframe (pd.DataFrame): Input dataframe
+    independent_var_col (str): Column name of the independent variable
+    dependent_var_col (str): Column name of the dependent variable
+    control_test_values (list): Array with control and test values
+    
+    Returns:
+    tuple: (n_control, mean_control, std_control, n_test, mean_test, std_test)
+    
+    Raises:
+    InvalidDataError: When a group is empty, all NaN, or too small
+    """
+    control_vec, test_vec, _, _ = extract_groups(
+        dataframe, independent_var_col, dependent_var_col, control_test_values
+    )
+    return _fused_stats(control_vec) + _fused_stats(test_vec)
+
+def _copy_on_write_enabled():
+    """
+    Returns whether pandas copy-on-write is active, which the cache relies on.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except (KeyError, pd.errors.OptionError):
+        return False
+
+def _backing_data(series):
+    """
+    Returns the array object holding a column's data, or None if unknown.
+    
+    NumPy-backed columns resolve to the root ndarray of their views. Extension
+    columns resolve to their ExtensionArray when pandas returns the same
+    object on every access.
+    """
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+        while isinstance(values.base, np.ndarray):
+            values = values.base
+        return values
+    values = series.array
+    return values if series.array is values else None
+
+def _cached_group_stats(dataframe, independent_var_col, dependent_var_col, control_test_values):
+    """
+    Memoized wrapper around _group_stats for repeated calls on one dataframe.
+    
+    Each entry holds references to the two columns it was computed from.
+    Under copy-on-write, any write to those columns then gives the dataframe
+    new backing arrays, so a hit is only served while the backing arrays are
+    unchanged; on a mismatch all of the dataframe's entries are dropped, since
+    they may hold stale columns too. Each dataframe keeps at most
+    _CACHE_MAXSIZE entries, evicting the least recently used, and entries are
+    dropped when the dataframe is garbage collected.
+    Dataframes with fewer than _CACHE_MIN_ROWS rows, columns whose backing
+    data cannot be identified, and pandas without copy-on-write bypass the
+    cache.
+    
+    Parameters:
+    dataframe (pd.DataFrame): Input dataframe
+    independent_var_col (str): Column name of the independent variable
+    dependent_var_col (str): Column name of the dependent variable
+    control_test_values (list): Array with control and test values
+    
+    Returns:
+    tuple: (n_control, mean_control, std_control, n_test, mean_test, std_test)
+    """
+    if len(dataframe) < _CACHE_MIN_ROWS or not _copy_on_write_enabled():
+        return _group_stats(
+            dataframe, independent_var_col, dependent_var_col, control_test_values
+        )
+    
+    control_value, test_value = control_test_values
+    key = (independent_var_col, dependent_var_col, control_value, test_value)
+    try:
+        hash(key)
+    except TypeError:
+        return _group_stats(
+            dataframe, independent_var_col, dependent_var_col, control_test_values
+        )
+    
+    independent_data = dataframe[independent_var_col]
+    dependent_data = dataframe[dependent_var_col]
+    backing = (_backing_data(independent_data), _backing_data(dependent_data))
+    if backing[0] is None or backing[1] is None:
+        return _group_stats(
+            dataframe, independent_var_col, dependent_var_col, control_test_values
+        )
+    
+    frame_id = id(dataframe)
+    frame_cache = _stats_cache.get(frame_id)
+    if frame_cache is None:
+        frame_cache = _stats_cache[frame_id] = OrderedDict()
+        weakref.finalize(dataframe, _stats_cache.pop, frame_id, None)
+    else:
+        entry = frame_cache.get(key)
+        if entry is not None:
+            stats, cached_backing, _ = entry
+            if cached_backing[0] is backing[0] and cached_backing[1] is backing[1]:
+                frame_cache.move_to_end(key)
+                return stats
+            # The dataframe was written to; release every column it pins
+            frame_cache.clear()
+    
+    stats = _group_stats(
+        dataframe, independent_var_col, dependent_var_col, control_test_values
+    )
+    # Holding the column Series makes pandas copy on the next write to them
+    frame_cache[key] = (stats, backing, (independent_data, dependent_data))
+    if len(frame_cache) > _CACHE_MAXSIZE:
+        frame_cache.popitem(last=False)
+    return stats
+
+def _compute_welch(mean_control, var_control, n_control, mean_test, var_test, n_test):
+    """
+    Computes Welch's t-statistic, 2-sided p-value and degrees of freedom.
+    
+    Parameters:
+    mean_control, mean_test (float or np.ndarray): Group means
+    var_control, var_test (float or np.ndarray): Group sample variances (ddof=1)
+    n_control, n_test (int or np.ndarray): Group sample sizes
+    
+    Returns:
+    tuple: (t_statistic, p_value, degrees_of_freedom)
+    """
+    t_statistic, df = welch_tdf(
+        mean_control, var_control, n_control,
+        mean_test, var_test, n_test
+    )
+    return t_statistic, two_sided_p_value(t_statistic, df), df
 
-def welch_t_test(dataframe, independent_var_col, dependent_var_col, control_test_values):
+def welch_t_test(dataframe, independent_var_col, dependent_var_col, control_test_values,
+                 _validate=True):
     """
     Performs Welch's 2-sided t-test on data from a dataframe.
     
@@ -18,6 +206,8 @@ def welch_t_test(dataframe, independent_var_col, dependent_var_col, control_test
     dependent_var_col (str): Column name of the dependent variable
     control_test_values (list): Array with two values [control_value, test_value] 
                                to identify control and test groups
+    _validate (bool): Whether to run validate_inputs first. Use
+                      welch_t_test_unchecked instead of passing False.
     
     Returns:
     dict: Dictionary containing test results
@@ -25,53 +215,194 @@ def welch_t_test(dataframe, independent_var_col, dependent_var_col, control_test
     Raises:
     InvalidColumnError: When specified columns don't exist in dataframe
     InvalidDataError: When data validation fails
-    WelchTTestError: When t-test calculation fails
+    StatisticalError: When t-test calculation fails
     """
-    try:
-        # Validate inputs
+    # Validate inputs
+    if _validate:
         validate_inputs(dataframe, independent_var_col, dependent_var_col, control_test_values)
-        
-        # Extract control and test groups
-        control_vec, test_vec, control_value, test_value = extract_groups(
-            dataframe, independent_var_col, dependent_var_col, control_test_values
+    
+    control_value, test_value = control_test_values
+    
+    (n_control, mean_control, std_control,
+     n_test, mean_test, std_test) = _cached_group_stats(
+        dataframe, independent_var_col, dependent_var_col, control_test_values
+    )
+    
+    # Perform Welch's t-test (assumes unequal variances)
+    try:
+        t_statistic, p_value, df = _compute_welch(
+            mean_control, std_control**2, n_control,
+            mean_test, std_test**2, n_test
         )
-        
-        # Perform Welch's t-test (assumes unequal variances)
-        t_statistic, p_value = ttest_ind(control_vec, test_vec, equal_var=False)
-        
-        # Calculate additional statistics
-        mean_control = np.mean(control_vec)
-        mean_test = np.mean(test_vec)
-        std_control = np.std(control_vec, ddof=1)
-        std_test = np.std(test_vec, ddof=1)
-        n_control = len(control_vec)
-        n_test = len(test_vec)
-        
-        # Calculate degrees of freedom for Welch's t-test
-        s1_sq = std_control**2
-        s2_sq = std_test**2
-        df = (s1_sq/n_control + s2_sq/n_test)**2 / (
-            (s1_sq/n_control)**2/(n_control-1) + (s2_sq/n_test)**2/(n_test-1)
+    except _NUMERIC_ERRORS as e:
+        raise StatisticalError(f"T-test calculation failed: {str(e)}") from e
+    
+    # Copying the pre-keyed template avoids rebuilding the hash table
+    results = _RESULT_TEMPLATE.copy()
+    results['t_statistic'] = t_statistic
+    results['p_value'] = p_value
+    results['degrees_of_freedom'] = df
+    results['mean_control'] = mean_control
+    results['mean_test'] = mean_test
+    results['std_control'] = std_control
+    results['std_test'] = std_test
+    results['n_control'] = n_control
+    results['n_test'] = n_test
+    results['mean_difference'] = mean_test - mean_control
+    results['control_value'] = control_value
+    results['test_value'] = test_value
+    
+    return results
+
+def welch_t_test_unchecked(dataframe, independent_var_col, dependent_var_col, control_test_values):
+    """
+    Performs Welch's 2-sided t-test without validating the inputs first.
+    
+    Intended for repeated calls on a dataframe that has already been checked
+    with validate_inputs. Group size checks still apply.
+    
+    Parameters:
+    dataframe (pd.DataFrame): Input dataframe
+    independent_var_col (str): Column name of the independent variable
+    dependent_var_col (str): Column name of the dependent variable
+    control_test_values (list): Array with two values [control_value, test_value] 
+                               to identify control and test groups
+    
+    Returns:
+    dict: Dictionary containing test results
+    
+    Raises:
+    InvalidDataError: When a group is empty, all NaN, or too small
+    StatisticalError: When t-test calculation fails
+    """
+    return welch_t_test(
+        dataframe, independent_var_col, dependent_var_col, control_test_values,
+        _validate=False
+    )
+
+def _column_stats(values, counts, has_nan=True):
+    """
+    Computes column-wise means and sample variances, ignoring NaN values.
+    
+    Columns with no observations get a NaN mean and columns with fewer than
+    2 observations get a NaN variance, without emitting warnings.
+    
+    Parameters:
+    values (np.ndarray): 2-D array of observations, one column per variable
+    counts (np.ndarray): Number of non-NaN observations per column
+    has_nan (bool): Whether values may contain NaN; plain sums are used if not
+    
+    Returns:
+    tuple: (means, variances) where variances use ddof=1
+    """
+    total = np.nansum if has_nan else np.sum
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = total(values, axis=0) / counts
+        deviations = values - means
+        variances = total(deviations * deviations, axis=0) / (counts - 1)
+    variances[counts < 2] = np.nan
+    return means, variances
+
+def welch_t_test_many(dataframe, independent_var_col, dependent_var_cols, control_test_values):
+    """
+    Performs Welch's 2-sided t-test on several dependent columns at once.
+    
+    The control and test masks are built once and the group statistics of
+    all dependent columns are reduced column-wise in a single pass.
+    
+    Parameters:
+    dataframe (pd.DataFrame): Input dataframe
+    independent_var_col (str): Column name of the independent variable
+    dependent_var_cols (list): Column names of the dependent variables; a
+                               single column name is also accepted
+    control_test_values (list): Array with two values [control_value, test_value] 
+                               to identify control and test groups
+    
+    Returns:
+    pd.DataFrame: One row of test results per dependent column, with the same
+                  fields as the dictionary returned by welch_t_test. Columns
+                  with fewer than 2 non-NaN observations in either group get
+                  NaN statistics; their counts are still reported.
+    
+    Raises:
+    InvalidColumnError: When specified columns don't exist in dataframe
+    InvalidDataError: When data validation fails
+    StatisticalError: When t-test calculation fails
+    """
+    if isinstance(dependent_var_cols, str):
+        dependent_var_cols = [dependent_var_cols]
+    dependent_var_cols = list(dependent_var_cols)
+    if len(dependent_var_cols) == 0:
+        raise InvalidDataError("dependent_var_cols must contain at least one column")
+    
+    # Validate inputs
+    validate_inputs(dataframe, independent_var_col, dependent_var_cols[0], control_test_values)
+    for col in dependent_var_cols[1:]:
+        if col not in dataframe.columns:
+            raise InvalidColumnError(f"Column '{col}' not found in dataframe")
+    
+    control_value, test_value = control_test_values
+    
+    # Build the group indexers once for all dependent columns
+    control_idx, test_idx = build_group_indexers(
+        dataframe[independent_var_col], control_value, test_value
+    )
+    
+    dependent_data = dataframe[dependent_var_cols]
+    for position, col in enumerate(dependent_var_cols):
+        check_numeric_column(dependent_data.iloc[:, position], col)
+    
+    values = dependent_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    control_values = values[control_idx]
+    test_values = values[test_idx]
+    
+    # Both groups must be present; sparse columns are handled per column
+    check_group_sizes(
+        control_value, test_value,
+        len(control_values), len(test_values),
+        len(control_values), len(test_values)
+    )
+    
+    # Plain NumPy integer and bool columns cannot hold NaN, so their counts
+    # are the group sizes and their NaN scan is skipped
+    nan_free = np.array([
+        isinstance(dtype, np.dtype) and dtype.kind in 'iub'
+        for dtype in dependent_data.dtypes
+    ])
+    n_control = np.full(len(dependent_var_cols), len(control_values))
+    n_test = np.full(len(dependent_var_cols), len(test_values))
+    has_nan = not nan_free.all()
+    if has_nan:
+        may_have_nan = ~nan_free
+        n_control[may_have_nan] = (~np.isnan(control_values[:, may_have_nan])).sum(axis=0)
+        n_test[may_have_nan] = (~np.isnan(test_values[:, may_have_nan])).sum(axis=0)
+    
+    mean_control, var_control = _column_stats(control_values, n_control, has_nan)
+    mean_test, var_test = _column_stats(test_values, n_test, has_nan)
+    
+    # Perform Welch's t-test (assumes unequal variances)
+    try:
+        t_statistic, p_value, df = _compute_welch(
+            mean_control, var_control, n_control,
+            mean_test, var_test, n_test
         )
-        
-        results = {
-            't_statistic': t_statistic,
-            'p_value': p_value,
-            'degrees_of_freedom': df,
-            'mean_control': mean_control,
-            'mean_test': mean_test,
-            'std_control': std_control,
-            'std_test': std_test,
-            'n_control': n_control,
-            'n_test': n_test,
-            'mean_difference': mean_test - mean_control,
-            'control_value': control_value,
-            'test_value': test_value
-        }
-        
-        return results
-        
-    except (InvalidColumnError, InvalidDataError) as e:
-        raise e
-    except Exception as e:
-        raise WelchTTestError(f"T-test calculation failed: {str(e)}") from e
\ No newline at end of file
+    except _NUMERIC_ERRORS as e:
+        raise StatisticalError(f"T-test calculation failed: {str(e)}") from e
+    
+    results = pd.DataFrame({
+        't_statistic': t_statistic,
+        'p_value': p_value,
+        'degrees_of_freedom': df,
+        'mean_control': mean_control,
+        'mean_test': mean_test,
+        'std_control': np.sqrt(var_control),
+        'std_test': np.sqrt(var_test),
+        'n_control': n_control,
+        'n_test': n_test,
+        'mean_difference': mean_test - mean_control,
+        'control_value': control_value,
+        'test_value': test_value
+    }, index=pd.Index(dependent_var_cols, name='dependent_var'))
+    
+    return results
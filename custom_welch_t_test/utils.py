@@ -51,6 +51,183 @@ def validate_inputs(dataframe, independent_var_col, dependent_var_col, control_t
             "control_test_values must contain exactly 2 values [control_value, test_value]"
         )
 
+def check_group_sizes(control_value, test_value, control_size, test_size,
+                      control_count, test_count):
+    """
+    Checks that both groups have enough observations for the t-test.
+    
+    Parameters:
+    control_value: Value identifying the control group
+    test_value: Value identifying the test group
+    control_size (int): Number of control rows, including NaN values
+    test_size (int): Number of test rows, including NaN values
+    control_count (int): Number of non-NaN control observations
+    test_count (int): Number of non-NaN test observations
+    
+    Raises:
+    InvalidDataError: When a group is empty, all NaN, or too small
+    """
+    # Check if both groups have data
+    if control_size == 0:
+        raise InvalidDataError(f"No data found for control value '{control_value}'")
+    
+    if test_size == 0:
+        raise InvalidDataError(f"No data found for test value '{test_value}'")
+    
+    # Check for valid data after removing NaN values
+    if control_count == 0:
+        raise InvalidDataError("No valid (non-NaN) data in control group")
+    
+    if test_count == 0:
+        raise InvalidDataError("No valid (non-NaN) data in test group")
+    
+    # Check for minimum sample size
+    if control_count < 2:
+        raise InvalidDataError("Control group must have at least 2 observations")
+    
+    if test_count < 2:
+        raise InvalidDataError("Test group must have at least 2 observations")
+
+def _category_mask(codes, categories, value):
+    """
+    Returns a boolean mask of the rows whose category code matches value.
+    """
+    try:
+        code = categories.get_loc(value)
+    except (KeyError, TypeError):
+        return np.zeros(len(codes), dtype=bool)
+    return codes == code
+
+def build_group_masks(independent_data, control_value, test_value):
+    """
+    Builds boolean masks selecting the control and test rows.
+    
+    Categorical columns are compared on their integer codes. Python-backed
+    string columns are converted to categoricals first, which is cheaper
+    than two element-wise string comparisons; object and Arrow-backed
+    columns compare faster directly.
+    
+    Parameters:
+    independent_data (pd.Series): Independent variable column
+    control_value: Value identifying the control group
+    test_value: Value identifying the test group
+    
+    Returns:
+    tuple: (control_mask, test_mask) as boolean numpy arrays
+    """
+    if (isinstance(independent_data.dtype, pd.StringDtype)
+            and independent_data.dtype.storage == 'python'):
+        independent_data = independent_data.astype('category')
+    
+    if isinstance(independent_data.dtype, pd.CategoricalDtype):
+        codes = independent_data.cat.codes.to_numpy()
+        categories = independent_data.cat.categories
+        return (
+            _category_mask(codes, categories, control_value),
+            _category_mask(codes, categories, test_value)
+        )
+    
+    # Plain NumPy numeric and object arrays compare directly on the ndarray
+    if isinstance(independent_data.dtype, np.dtype) and independent_data.dtype.kind in 'biufcO':
+        independent_arr = independent_data.to_numpy()
+        return independent_arr == control_value, independent_arr == test_value
+    
+    # Other dtypes (datetimes, nullable and Arrow-backed columns) keep pandas
+    # comparison semantics, e.g. matching '2020-01-01' against datetime64
+    return (
+        (independent_data == control_value).to_numpy(dtype=bool, na_value=False),
+        (independent_data == test_value).to_numpy(dtype=bool, na_value=False)
+    )
+
+def _sorted_group_slice(independent_arr, value, descending=False):
+    """
+    Returns the slice of rows equal to value in a sorted array.
+    """
+    # A descending array is searched through its ascending reversed view
+    search_arr = independent_arr[::-1] if descending else independent_arr
+    lo = np.searchsorted(search_arr, value, side='left')
+    hi = np.searchsorted(search_arr, value, side='right')
+    # Guard against values that compare oddly with the array's dtype
+    if hi > lo and not (search_arr[lo] == value and search_arr[hi - 1] == value):
+        raise TypeError(f"Value {value!r} cannot be located in a sorted column")
+    if descending:
+        lo, hi = len(search_arr) - hi, len(search_arr) - lo
+    return slice(int(lo), int(hi))
+
+def build_group_indexers(independent_data, control_value, test_value):
+    """
+    Builds indexers selecting the control and test rows.
+    
+    When a plain NumPy numeric or object column is sorted in either
+    direction, each group is a contiguous run of rows and is located with two
+    binary searches; the returned slices give views of other arrays instead
+    of copies. Otherwise falls back to the boolean masks from
+    build_group_masks. For unsorted columns the sortedness checks stop once
+    the column is known to be neither ascending nor descending; sorted
+    columns are scanned in full.
+    
+    Parameters:
+    independent_data (pd.Series): Independent variable column
+    control_value: Value identifying the control group
+    test_value: Value identifying the test group
+    
+    Returns:
+    tuple: (control_indexer, test_indexer) as slices or boolean numpy arrays
+    """
+    dtype = independent_data.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufO':
+        if independent_data.is_monotonic_increasing:
+            descending = False
+        elif independent_data.is_monotonic_decreasing:
+            descending = True
+        else:
+            descending = None
+        
+        if descending is not None:
+            independent_arr = independent_data.to_numpy()
+            try:
+                return (
+                    _sorted_group_slice(independent_arr, control_value, descending),
+                    _sorted_group_slice(independent_arr, test_value, descending)
+                )
+            except TypeError:
+                pass
+    
+    return build_group_masks(independent_data, control_value, test_value)
+
+# Value kinds from pd.api.types.infer_dtype accepted in object columns
+_NUMERIC_OBJECT_KINDS = {'integer', 'floating', 'mixed-integer-float', 'decimal', 'boolean', 'empty'}
+
+def check_numeric_column(dependent_data, dependent_var_col):
+    """
+    Checks that a dependent variable column holds real numbers.
+    
+    Real numeric and bool dtypes are accepted, as are object columns whose
+    values are all numbers. Datetime-like, string, categorical and complex
+    columns are rejected rather than cast to float.
+    
+    Parameters:
+    dependent_data (pd.Series): Dependent variable column
+    dependent_var_col (str): Column name, used in the error message
+    
+    Raises:
+    InvalidDataError: When the column does not hold real numbers
+    """
+    dtype = dependent_data.dtype
+    if pd.api.types.is_complex_dtype(dtype):
+        raise InvalidDataError(f"Column '{dependent_var_col}' must contain real numeric data")
+    
+    if pd.api.types.is_numeric_dtype(dtype):
+        return
+    
+    if (pd.api.types.is_object_dtype(dtype)
+            and pd.api.types.infer_dtype(dependent_data, skipna=True) in _NUMERIC_OBJECT_KINDS):
+        return
+    
+    raise InvalidDataError(
+        f"Column '{dependent_var_col}' must contain numeric data, got dtype '{dtype}'"
+    )
+
 def extract_groups(dataframe, independent_var_col, dependent_var_col, control_test_values):
     """
     Extracts control and test groups from the dataframe.
@@ -69,34 +246,34 @@ def extract_groups(dataframe, independent_var_col, dependent_var_col, control_te
     """
     control_value, test_value = control_test_values
     
-    # Filter data for control and test groups
-    control_data = dataframe[dataframe[independent_var_col] == control_value][dependent_var_col]
-    test_data = dataframe[dataframe[independent_var_col] == test_value][dependent_var_col]
-    
-    # Check if both groups have data
-    if len(control_data) == 0:
-        raise InvalidDataError(f"No data found for control value '{control_value}'")
-    
-    if len(test_data) == 0:
-        raise InvalidDataError(f"No data found for test value '{test_value}'")
+    # Pull the dependent column into one contiguous float64 array up front
+    dependent_data = dataframe[dependent_var_col]
+    check_numeric_column(dependent_data, dependent_var_col)
+    dependent_arr = np.ascontiguousarray(
+        dependent_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    )
     
-    # Convert to numpy arrays and remove NaN values
-    control_vec = control_data.dropna().values
-    test_vec = test_data.dropna().values
+    # Select the groups by slice when the column is sorted, else by mask
+    control_idx, test_idx = build_group_indexers(
+        dataframe[independent_var_col], control_value, test_value
+    )
     
-    # Check for valid data after removing NaN values
-    if len(control_vec) == 0:
-        raise InvalidDataError("No valid (non-NaN) data in control group")
+    control_data = dependent_arr[control_idx]
+    test_data = dependent_arr[test_idx]
     
-    if len(test_vec) == 0:
-        raise InvalidDataError("No valid (non-NaN) data in test group")
+    # Remove NaN values; plain NumPy integer and bool columns cannot hold any
+    if isinstance(dependent_data.dtype, np.dtype) and dependent_data.dtype.kind in 'iub':
+        control_vec = control_data
+        test_vec = test_data
+    else:
+        control_vec = control_data[~np.isnan(control_data)]
+        test_vec = test_data[~np.isnan(test_data)]
     
-    # Check for minimum sample size
-    if len(control_vec) < 2:
-        raise InvalidDataError("Control group must have at least 2 observations")
-    
-    if len(test_vec) < 2:
-        raise InvalidDataError("Test group must have at least 2 observations")
+    check_group_sizes(
+        control_value, test_value,
+        len(control_data), len(test_data),
+        len(control_vec), len(test_vec)
+    )
     
     return control_vec, test_vec, control_value, test_value
 